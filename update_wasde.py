@@ -4,46 +4,114 @@ WASDE Dashboard Auto-Updater
 Downloads the latest WASDE Excel file from USDA and regenerates the dashboard data.
 Run monthly after WASDE release (typically 10th-12th of each month).
 
-Usage: python update_wasde.py [--year YYYY] [--month MM]
-  Defaults to current year/month.
+Usage: python update_wasde.py [--year YYYY] [--month MM] [--no-cache]
+  Defaults to current year/month. Downloads and extracted data are cached
+  in .cache/ and the download is revalidated against USDA with a HEAD /
+  conditional GET; pass --no-cache to force a fresh download and re-extract.
 """
 
-import sys, os, json, re, argparse
+import sys, json, re, argparse, hashlib, operator, shutil, threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.request import urlretrieve
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 from pathlib import Path
 
 try:
     import xlrd
 except ImportError:
-    print("Installing xlrd..."); os.system(f"{sys.executable} -m pip install xlrd --quiet"); import xlrd
+    raise SystemExit("xlrd is required: pip install -r requirements.txt")
 
 SCRIPT_DIR = Path(__file__).parent
 TEMPLATE_PATH = SCRIPT_DIR / "index.html"
+CACHE_DIR = SCRIPT_DIR / ".cache"
+
+_RE_WASDE_ID = re.compile(r'WASDE[- ]+(\d+)')
+DATA_START = 'const WASDE_DATA = {'
+DATA_END = '// ========== END DATA =========='
 
 def month_code(month):
     """WASDE file uses 2-digit month + 2-digit year: wasde0226.xls = Feb 2026"""
     return f"{month:02d}"
 
-def download_wasde(year, month):
+def http_validators(headers):
+    """The response headers we compare to decide whether a cached download is still current."""
+    return {k: headers.get(h) for k, h in
+            [('etag', 'ETag'), ('lastModified', 'Last-Modified'), ('contentLength', 'Content-Length')]}
+
+def projection_year(year, month):
+    """Marketing year projected by a report, e.g. '2025/26' for Feb 2026.
+
+    WASDE rolls to the new crop year with the May report.
+    """
+    start = year if month >= 5 else year - 1
+    return f"{start}/{(start + 1) % 100:02d}"
+
+def download_wasde(year, month, use_cache=True):
     yy = year % 100
     mm = month_code(month)
     filename = f"wasde{mm}{yy}.xls"
     url = f"https://www.usda.gov/oce/commodity/wasde/{filename}"
-    local = SCRIPT_DIR / filename
+    CACHE_DIR.mkdir(exist_ok=True)
+    local = CACHE_DIR / filename
+    meta_path = CACHE_DIR / f"{filename}.meta.json"
+    meta = None
+    if use_cache and local.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text(encoding='utf-8'))
+
+    # Cheap HEAD first: if size and validators still match, skip the download entirely.
+    # Size alone proves nothing (.xls files are padded to 512-byte sectors), so a real
+    # validator (ETag or Last-Modified) is required to trust it.
+    if meta and (meta.get('etag') or meta.get('lastModified')):
+        try:
+            with urlopen(Request(url, method='HEAD'), timeout=30) as resp:
+                fresh = http_validators(resp.headers)
+            if fresh == meta and fresh['contentLength'] == str(local.stat().st_size):
+                print(f"Using cached {local} ({local.stat().st_size:,} bytes, unchanged on server)")
+                return local
+        except Exception as e:
+            print(f"  HEAD failed ({e}), trying a conditional GET")
+
+    headers = {}
+    if meta and meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta and meta.get('lastModified'):
+        headers['If-Modified-Since'] = meta['lastModified']
+
     print(f"Downloading {url} ...")
+    part = local.with_name(f"{filename}.part")
     try:
-        urlretrieve(url, local)
+        with urlopen(Request(url, headers=headers), timeout=120) as resp, open(part, 'wb') as f:
+            shutil.copyfileobj(resp, f)
+            fresh = http_validators(resp.headers)
+    except HTTPError as e:
+        if e.code == 304:
+            print(f"  Not modified; using cached {local}")
+            return local
+        error = e
+    except Exception as e:
+        error = e
+    else:
+        part.replace(local)
+        meta_path.write_text(json.dumps(fresh), encoding='utf-8')
         print(f"  Saved {local} ({local.stat().st_size:,} bytes)")
         return local
-    except Exception as e:
-        print(f"  ERROR: {e}")
-        return None
+
+    print(f"  ERROR: {error}")
+    part.unlink(missing_ok=True)  # don't leave a partial file behind
+    if use_cache and local.exists():
+        print(f"  Falling back to cached {local}")
+        return local
+    return None
 
 def safe(val):
     """Convert cell value to float, return 0 if empty."""
+    if type(val) is float:  # xlrd numeric cells, by far the common case
+        return val
+    if val == '':
+        return 0
     try:
-        return float(val) if val != '' else 0
+        return float(val)
     except (ValueError, TypeError):
         return 0
 
@@ -51,36 +119,67 @@ def try_read_sheet(wb, name):
     """Try to read a named sheet; return list-of-rows or None if sheet missing."""
     try:
         s = wb.sheet_by_name(name)
-        return [[s.cell_value(r, c) for c in range(s.ncols)] for r in range(s.nrows)]
+        rows = [s.row_values(r) for r in range(s.nrows)]
+        wb.unload_sheet(name)
+        return rows
     except Exception:
         return None
 
-def find_section(rows, label):
-    """Return index of first row whose col-0 starts with label (case-insensitive)."""
+def col_labels(rows, col=0):
+    """Stripped text of one column for every row; compute once per sheet and share."""
+    return [str(row[col]).strip() for row in rows]
+
+def find_section(labels, label):
+    """Return index of first label that starts with label (case-insensitive)."""
     label_lower = label.lower()
-    for i, row in enumerate(rows):
-        if str(row[0]).strip().lower().startswith(label_lower):
+    for i, text in enumerate(labels):
+        if text.lower().startswith(label_lower):
             return i
     return 0
 
-def get_col_row(rows, label, start=0, end=None):
-    """Search col-0 for label between start/end; return [safe(cols 1-4)]."""
-    if end is None:
-        end = len(rows)
-    for i in range(start, end):
-        if str(rows[i][0]).strip().lower().startswith(label.lower()):
-            return [safe(rows[i][j]) for j in range(1, 5)]
-    return [0, 0, 0, 0]
+_PREFIX_LEN = 4  # shortest label we look up ('Food', 'Seed')
+
+def build_label_index(labels):
+    """Bucket label positions by their first _PREFIX_LEN characters, keeping row order."""
+    index = {}
+    for i, text in enumerate(labels):
+        index.setdefault(text[:_PREFIX_LEN], []).append(i)
+    return index
+
+def find_label(labels, index, label):
+    """Return position of the first label starting with `label`, or None."""
+    candidates = index.get(label[:_PREFIX_LEN], ()) if len(label) >= _PREFIX_LEN else range(len(labels))
+    for i in candidates:
+        if labels[i].startswith(label):
+            return i
+    return None
+
+def section_lookup(rows, labels, start=0, end=None, value_cols=(1, 2, 3, 4), ignore_case=True):
+    """Index labels[start:end] once; return get(label) -> [safe(value_cols)], zeros if absent.
+
+    labels is the sheet's col_labels() for whichever column holds the row labels.
+    """
+    labels = labels[start:end]
+    if ignore_case:
+        labels = [text.lower() for text in labels]
+    index = build_label_index(labels)
+    pick = operator.itemgetter(*value_cols)  # value_cols always has several entries, so pick() yields a tuple
+
+    def get(label):
+        i = find_label(labels, index, label.lower() if ignore_case else label)
+        if i is None:
+            return [0] * len(value_cols)
+        return [safe(v) for v in pick(rows[start + i])]
+
+    return get
 
-def parse_simple_crop(rows, section_label):
+def parse_simple_crop(rows, section_label, labels=None):
     """Generic parser for crops with corn-style layout (label in col 0, data cols 1-4)."""
     if not rows:
         return {k: [0, 0, 0, 0] for k in ['price', 'production', 'begStocks', 'imports',
                                             'supplyTotal', 'feedResidual', 'exports', 'useTotal', 'endStocks']}
-    start = find_section(rows, section_label)
-
-    def get(label):
-        return get_col_row(rows, label, start)
+    labels = labels or col_labels(rows)
+    get = section_lookup(rows, labels, find_section(labels, section_label))
 
     return {
         'price':        get('Avg. Farm Price'),
@@ -95,115 +194,111 @@ def parse_simple_crop(rows, section_label):
         'endStocks':    get('Ending Stocks'),
     }
 
-def extract_data(xls_path, year, month):
-    wb = xlrd.open_workbook(str(xls_path))
-
-    # Determine report number from first sheet
-    txt_sheet = wb.sheet_by_name('WASDE Text')
-    report_id = "WASDE"
+def find_report_id(txt_sheet):
+    """Scan the top-left header block row by row; return the first 'WASDE-NNN' found."""
     for r in range(min(10, txt_sheet.nrows)):
         for c_idx in range(min(5, txt_sheet.ncols)):
-            val = str(txt_sheet.cell_value(r, c_idx))
-            m = re.search(r'WASDE[- ]+(\d+)', val)
+            m = _RE_WASDE_ID.search(str(txt_sheet.cell_value(r, c_idx)))
             if m:
-                report_id = f"WASDE-{m.group(1)}"
-                break
+                return f"WASDE-{m.group(1)}"
+    return "WASDE"
 
-    month_names = ["", "January", "February", "March", "April", "May", "June",
-                   "July", "August", "September", "October", "November", "December"]
-    report_date = f"{month_names[month]} {year}"
+_SHEET_LOCK = threading.Lock()
+
+def read_sheet(wb, name):
+    """Read a sheet as list-of-rows, or [] with a warning if it is missing.
 
-    def read_sheet(name):
+    xlrd workbooks aren't thread-safe, so loading/unloading a sheet is serialized;
+    the returned rows are plain lists and can be scanned without the lock.
+    """
+    with _SHEET_LOCK:
         rows = try_read_sheet(wb, name)
-        if rows is None:
-            print(f"  WARNING: Sheet '{name}' not found — zeros will be used")
-            return []
-        return rows
+    if rows is None:
+        print(f"  WARNING: Sheet '{name}' not found — zeros will be used")
+        return []
+    return rows
 
-    # -----------------------------------------------------------------------
-    # CORN (Page 12)
-    # -----------------------------------------------------------------------
-    corn_rows = read_sheet('Page 12')
-    corn_start = find_section(corn_rows, 'CORN')
+def extract_corn(wb):
+    """Corn balance sheet (Page 12)."""
+    corn_rows = read_sheet(wb, 'Page 12')
+    corn_labels = col_labels(corn_rows)
+    get_corn = section_lookup(corn_rows, corn_labels, find_section(corn_labels, 'CORN'))
 
     corn = {
-        'price':         get_col_row(corn_rows, 'Avg. Farm Price',        corn_start),
-        'planted':       get_col_row(corn_rows, 'Area Planted',            corn_start),
-        'harvested':     get_col_row(corn_rows, 'Area Harvested',          corn_start),
-        'yield':         get_col_row(corn_rows, 'Yield per',               corn_start),
-        'begStocks':     get_col_row(corn_rows, 'Beginning Stocks',        corn_start),
-        'production':    get_col_row(corn_rows, 'Production',              corn_start),
-        'imports':       get_col_row(corn_rows, 'Imports',                 corn_start),
-        'supplyTotal':   get_col_row(corn_rows, 'Supply, Total',           corn_start),
-        'feedResidual':  get_col_row(corn_rows, 'Feed and Residual',       corn_start),
-        'fsi':           get_col_row(corn_rows, 'Food, Seed & Industrial', corn_start),
-        'ethanol':       get_col_row(corn_rows, 'Ethanol',                 corn_start),
-        'domesticTotal': get_col_row(corn_rows, 'Domestic, Total',         corn_start),
-        'exports':       get_col_row(corn_rows, 'Exports',                 corn_start),
-        'useTotal':      get_col_row(corn_rows, 'Use, Total',              corn_start),
-        'endStocks':     get_col_row(corn_rows, 'Ending Stocks',           corn_start),
+        'price':         get_corn('Avg. Farm Price'),
+        'planted':       get_corn('Area Planted'),
+        'harvested':     get_corn('Area Harvested'),
+        'yield':         get_corn('Yield per'),
+        'begStocks':     get_corn('Beginning Stocks'),
+        'production':    get_corn('Production'),
+        'imports':       get_corn('Imports'),
+        'supplyTotal':   get_corn('Supply, Total'),
+        'feedResidual':  get_corn('Feed and Residual'),
+        'fsi':           get_corn('Food, Seed & Industrial'),
+        'ethanol':       get_corn('Ethanol'),
+        'domesticTotal': get_corn('Domestic, Total'),
+        'exports':       get_corn('Exports'),
+        'useTotal':      get_corn('Use, Total'),
+        'endStocks':     get_corn('Ending Stocks'),
     }
+    return corn
 
-    # -----------------------------------------------------------------------
-    # SOYBEANS (Page 15)
-    # -----------------------------------------------------------------------
-    soy_rows = read_sheet('Page 15')
+def extract_soy(wb):
+    """Soybean, soybean oil and soybean meal balance sheets (Page 15)."""
+    soy_rows = read_sheet(wb, 'Page 15')
+    soy_labels = col_labels(soy_rows)
     total_soy_rows = len(soy_rows)
-    soy_start  = find_section(soy_rows, 'SOYBEANS')
-    oil_start  = find_section(soy_rows, 'SOYBEAN OIL')
-    meal_start = find_section(soy_rows, 'SOYBEAN MEAL')
+    soy_start  = find_section(soy_labels, 'SOYBEANS')
+    oil_start  = find_section(soy_labels, 'SOYBEAN OIL')
+    meal_start = find_section(soy_labels, 'SOYBEAN MEAL')
     print(f"  Soy sections — beans: row {soy_start}, oil: row {oil_start}, meal: row {meal_start}, total: {total_soy_rows}")
 
-    def get_soy(label, start, end):
-        label_lower = label.lower()
-        for i in range(start, end):
-            if str(soy_rows[i][0]).strip().lower().startswith(label_lower):
-                return [safe(soy_rows[i][j]) for j in range(1, 5)]
-        return [0, 0, 0, 0]
+    get_beans = section_lookup(soy_rows, soy_labels, soy_start, oil_start)
+    get_oil   = section_lookup(soy_rows, soy_labels, oil_start, meal_start)
+    get_meal  = section_lookup(soy_rows, soy_labels, meal_start, total_soy_rows)
 
     soybeans = {
-        'price':         get_soy('Avg. Farm Price',        soy_start, oil_start),
-        'planted':       get_soy('Area Planted',            soy_start, oil_start),
-        'harvested':     get_soy('Area Harvested',          soy_start, oil_start),
-        'yield':         get_soy('Yield per',               soy_start, oil_start),
-        'begStocks':     get_soy('Beginning Stocks',        soy_start, oil_start),
-        'production':    get_soy('Production',              soy_start, oil_start),
-        'imports':       get_soy('Imports',                 soy_start, oil_start),
-        'supplyTotal':   get_soy('Supply, Total',           soy_start, oil_start),
-        'crushings':     get_soy('Crushings',               soy_start, oil_start),
-        'exports':       get_soy('Exports',                 soy_start, oil_start),
-        'seed':          get_soy('Seed',                    soy_start, oil_start),
-        'residual':      get_soy('Residual',                soy_start, oil_start),
-        'useTotal':      get_soy('Use, Total',              soy_start, oil_start),
-        'endStocks':     get_soy('Ending Stocks',           soy_start, oil_start),
+        'price':         get_beans('Avg. Farm Price'),
+        'planted':       get_beans('Area Planted'),
+        'harvested':     get_beans('Area Harvested'),
+        'yield':         get_beans('Yield per'),
+        'begStocks':     get_beans('Beginning Stocks'),
+        'production':    get_beans('Production'),
+        'imports':       get_beans('Imports'),
+        'supplyTotal':   get_beans('Supply, Total'),
+        'crushings':     get_beans('Crushings'),
+        'exports':       get_beans('Exports'),
+        'seed':          get_beans('Seed'),
+        'residual':      get_beans('Residual'),
+        'useTotal':      get_beans('Use, Total'),
+        'endStocks':     get_beans('Ending Stocks'),
         'oil': {
-            'price':       get_soy('Avg. Price',             oil_start, meal_start),
-            'production':  get_soy('Production',             oil_start, meal_start),
-            'domesticUse': get_soy('Domestic Disappearance', oil_start, meal_start),
-            'biofuel':     get_soy('Biofuel',                oil_start, meal_start),
-            'exports':     get_soy('Exports',                oil_start, meal_start),
-            'endStocks':   get_soy('Ending Stocks',          oil_start, meal_start),
+            'price':       get_oil('Avg. Price'),
+            'production':  get_oil('Production'),
+            'domesticUse': get_oil('Domestic Disappearance'),
+            'biofuel':     get_oil('Biofuel'),
+            'exports':     get_oil('Exports'),
+            'endStocks':   get_oil('Ending Stocks'),
         },
         'meal': {
-            'price':       get_soy('Avg. Price',             meal_start, total_soy_rows),
-            'production':  get_soy('Production',             meal_start, total_soy_rows),
-            'domesticUse': get_soy('Domestic Disappearance', meal_start, total_soy_rows),
-            'exports':     get_soy('Exports',                meal_start, total_soy_rows),
-            'endStocks':   get_soy('Ending Stocks',          meal_start, total_soy_rows),
+            'price':       get_meal('Avg. Price'),
+            'production':  get_meal('Production'),
+            'domesticUse': get_meal('Domestic Disappearance'),
+            'exports':     get_meal('Exports'),
+            'endStocks':   get_meal('Ending Stocks'),
         },
     }
+    return soybeans
 
-    # -----------------------------------------------------------------------
-    # WHEAT (Page 11)
-    # -----------------------------------------------------------------------
-    wheat_rows = read_sheet('Page 11')
+def extract_wheat(wb, proj_year):
+    """Wheat balance sheet and wheat-by-class table (Page 11); returns (wheat, wheat_by_class).
+
+    proj_year is the projected marketing year label ('2025/26') that heads the by-class projection rows.
+    """
+    wheat_rows = read_sheet(wb, 'Page 11')
+    wheat_labels = col_labels(wheat_rows)
 
-    def get_wheat_row(label, start=0, end=30):
-        for i in range(start, min(end, len(wheat_rows))):
-            if str(wheat_rows[i][0]).strip().startswith(label):
-                return [safe(wheat_rows[i][4]), safe(wheat_rows[i][6]),
-                        safe(wheat_rows[i][9]), safe(wheat_rows[i][11])]
-        return [0, 0, 0, 0]
+    get_wheat_row = section_lookup(wheat_rows, wheat_labels, 0, 30, value_cols=(4, 6, 9, 11), ignore_case=False)
 
     wheat = {
         'price':         get_wheat_row('Avg. Farm Price'),
@@ -225,23 +320,18 @@ def extract_data(xls_path, year, month):
 
     # Wheat by class (bottom of Page 11)
     wbc_start = 0
-    for i, row in enumerate(wheat_rows):
-        if 'Wheat by Class' in str(row[0]) or 'by Class' in str(row[0]):
+    for i, text in enumerate(wheat_labels):
+        if 'by Class' in text:
             wbc_start = i
             break
     proj_row_start = 0
     for i in range(wbc_start, len(wheat_rows)):
-        if '2025/26' in str(wheat_rows[i][0]):
+        if proj_year in wheat_labels[i]:
             proj_row_start = i
             break
 
-    def get_wbc_row(label, start=proj_row_start):
-        for i in range(start, min(start + 15, len(wheat_rows))):
-            if str(wheat_rows[i][1]).strip().startswith(label):
-                return [safe(wheat_rows[i][3]), safe(wheat_rows[i][5]),
-                        safe(wheat_rows[i][7]), safe(wheat_rows[i][8]),
-                        safe(wheat_rows[i][10])]
-        return [0, 0, 0, 0, 0]
+    get_wbc_row = section_lookup(wheat_rows, col_labels(wheat_rows, 1), proj_row_start, proj_row_start + 15,
+                                 value_cols=(3, 5, 7, 8, 10), ignore_case=False)
 
     wheat_by_class = {
         'labels':     ["HRW", "HRS", "SRW", "White", "Durum"],
@@ -249,97 +339,125 @@ def extract_data(xls_path, year, month):
         'exports':    get_wbc_row('Exports'),
         'endStocks':  get_wbc_row('Ending Stocks, Total'),
     }
+    return wheat, wheat_by_class
 
-    # -----------------------------------------------------------------------
-    # SORGHUM (Page 13 — shares sheet with Barley & Oats)
-    # -----------------------------------------------------------------------
-    sorghum = parse_simple_crop(read_sheet('Page 13'), 'SORGHUM')
-
-    # -----------------------------------------------------------------------
-    # OATS (Page 13 — same sheet as Sorghum & Barley)
-    # -----------------------------------------------------------------------
-    oats_rows = read_sheet('Page 13') or []
-    oats_start = find_section(oats_rows, 'OATS') if oats_rows else 0
-
-    def get_oats(label):
-        return get_col_row(oats_rows, label, oats_start)
-
-    oats = {
-        'price':          get_oats('Avg. Farm Price'),
-        'production':     get_oats('Production'),
-        'begStocks':      get_oats('Beginning Stocks'),
-        'imports':        get_oats('Imports'),
-        'supplyTotal':    get_oats('Supply, Total'),
-        'fsi':            get_oats('Food, Seed & Industrial'),
-        'feedResidual':   get_oats('Feed and Residual'),
-        'exports':        get_oats('Exports'),
-        'useTotal':       get_oats('Use, Total'),
-        'endStocks':      get_oats('Ending Stocks'),
-    }
-
-    # -----------------------------------------------------------------------
-    # RICE — U.S. (Page 14)
-    # -----------------------------------------------------------------------
-    rice_rows = read_sheet('Page 14')
-    rice_start = find_section(rice_rows, 'TOTAL RICE') if rice_rows else 0
-
-    def get_rice(label):
-        return get_col_row(rice_rows, label, rice_start)
-
-    rice = {
-        'price':       get_rice('Avg. Farm Price'),
-        'production':  get_rice('Production'),
-        'begStocks':   get_rice('Beginning Stocks'),
-        'imports':     get_rice('Imports'),
-        'supplyTotal': get_rice('Supply, Total'),
-        'domesticUse': get_rice('Domestic & Residual'),
-        'exports':     get_rice('Exports, Total'),
-        'useTotal':    get_rice('Use, Total'),
-        'endStocks':   get_rice('Ending Stocks'),
-    }
-
-    # World Rice (Page 24)
-    world_rice_rows = read_sheet('Page 24') or []
-    w_rice_start = find_section(world_rice_rows, 'WORLD') if world_rice_rows else 0
-
-    world_rice = {
-        'production':  get_col_row(world_rice_rows, 'Production',   w_rice_start),
-        'consumption': get_col_row(world_rice_rows, 'Consumption',  w_rice_start),
-        'trade':       get_col_row(world_rice_rows, 'Trade',         w_rice_start),
-        'endStocks':   get_col_row(world_rice_rows, 'Ending Stocks', w_rice_start),
-    }
-
-    # -----------------------------------------------------------------------
-    # COTTON — U.S. (Page 17)
-    # -----------------------------------------------------------------------
-    cotton_rows = read_sheet('Page 17')
-    cotton_start = 0  # no crop header on this page; data starts from top
-
-    def get_cotton(label):
-        return get_col_row(cotton_rows, label, cotton_start)
-
-    cotton = {
-        'price':       get_cotton('Avg. Farm Price'),
-        'production':  get_cotton('Production'),
-        'begStocks':   get_cotton('Beginning Stocks'),
-        'imports':     get_cotton('Imports'),
-        'supplyTotal': get_cotton('Supply, Total'),
-        'domesticUse': get_cotton('Domestic Use'),
-        'exports':     get_cotton('Exports, Total'),
-        'useTotal':    get_cotton('Use, Total'),
-        'endStocks':   get_cotton('Ending Stocks'),
-    }
-
-    # World Cotton (Page 26)
-    world_cotton_rows = read_sheet('Page 26') or []
-    w_cotton_start = find_section(world_cotton_rows, 'WORLD') if world_cotton_rows else 0
+def extract_data(xls_path, year, month):
+    # on_demand: only the handful of sheets we read get parsed, not all ~40
+    wb = xlrd.open_workbook(str(xls_path), on_demand=True, formatting_info=False)
+    try:
+        # Determine report number from first sheet
+        report_id = find_report_id(wb.sheet_by_name('WASDE Text'))
+        wb.unload_sheet('WASDE Text')
+
+        # Corn, soy and wheat are independent; extract them alongside the smaller crops below
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            corn_future  = pool.submit(extract_corn, wb)
+            soy_future   = pool.submit(extract_soy, wb)
+            wheat_future = pool.submit(extract_wheat, wb, projection_year(year, month))
+
+            # -----------------------------------------------------------------------
+            # SORGHUM (Page 13 — shares sheet with Barley & Oats)
+            # -----------------------------------------------------------------------
+            page13_rows = read_sheet(wb, 'Page 13')
+            page13_labels = col_labels(page13_rows)
+            sorghum = parse_simple_crop(page13_rows, 'SORGHUM', page13_labels)
+
+            # -----------------------------------------------------------------------
+            # OATS (Page 13 — same sheet as Sorghum & Barley)
+            # -----------------------------------------------------------------------
+            oats_start = find_section(page13_labels, 'OATS') if page13_rows else 0
+
+            get_oats = section_lookup(page13_rows, page13_labels, oats_start)
+
+            oats = {
+                'price':          get_oats('Avg. Farm Price'),
+                'production':     get_oats('Production'),
+                'begStocks':      get_oats('Beginning Stocks'),
+                'imports':        get_oats('Imports'),
+                'supplyTotal':    get_oats('Supply, Total'),
+                'fsi':            get_oats('Food, Seed & Industrial'),
+                'feedResidual':   get_oats('Feed and Residual'),
+                'exports':        get_oats('Exports'),
+                'useTotal':       get_oats('Use, Total'),
+                'endStocks':      get_oats('Ending Stocks'),
+            }
+
+            # -----------------------------------------------------------------------
+            # RICE — U.S. (Page 14)
+            # -----------------------------------------------------------------------
+            rice_rows = read_sheet(wb, 'Page 14')
+            rice_labels = col_labels(rice_rows)
+            rice_start = find_section(rice_labels, 'TOTAL RICE') if rice_rows else 0
+
+            get_rice = section_lookup(rice_rows, rice_labels, rice_start)
+
+            rice = {
+                'price':       get_rice('Avg. Farm Price'),
+                'production':  get_rice('Production'),
+                'begStocks':   get_rice('Beginning Stocks'),
+                'imports':     get_rice('Imports'),
+                'supplyTotal': get_rice('Supply, Total'),
+                'domesticUse': get_rice('Domestic & Residual'),
+                'exports':     get_rice('Exports, Total'),
+                'useTotal':    get_rice('Use, Total'),
+                'endStocks':   get_rice('Ending Stocks'),
+            }
+
+            # World Rice (Page 24)
+            world_rice_rows = read_sheet(wb, 'Page 24') or []
+            world_rice_labels = col_labels(world_rice_rows)
+            w_rice_start = find_section(world_rice_labels, 'WORLD') if world_rice_rows else 0
+            get_world_rice = section_lookup(world_rice_rows, world_rice_labels, w_rice_start)
+
+            world_rice = {
+                'production':  get_world_rice('Production'),
+                'consumption': get_world_rice('Consumption'),
+                'trade':       get_world_rice('Trade'),
+                'endStocks':   get_world_rice('Ending Stocks'),
+            }
+
+            # -----------------------------------------------------------------------
+            # COTTON — U.S. (Page 17)
+            # -----------------------------------------------------------------------
+            cotton_rows = read_sheet(wb, 'Page 17')
+            cotton_start = 0  # no crop header on this page; data starts from top
+
+            get_cotton = section_lookup(cotton_rows, col_labels(cotton_rows), cotton_start)
+
+            cotton = {
+                'price':       get_cotton('Avg. Farm Price'),
+                'production':  get_cotton('Production'),
+                'begStocks':   get_cotton('Beginning Stocks'),
+                'imports':     get_cotton('Imports'),
+                'supplyTotal': get_cotton('Supply, Total'),
+                'domesticUse': get_cotton('Domestic Use'),
+                'exports':     get_cotton('Exports, Total'),
+                'useTotal':    get_cotton('Use, Total'),
+                'endStocks':   get_cotton('Ending Stocks'),
+            }
+
+            # World Cotton (Page 26)
+            world_cotton_rows = read_sheet(wb, 'Page 26') or []
+            world_cotton_labels = col_labels(world_cotton_rows)
+            w_cotton_start = find_section(world_cotton_labels, 'WORLD') if world_cotton_rows else 0
+            get_world_cotton = section_lookup(world_cotton_rows, world_cotton_labels, w_cotton_start)
+
+            world_cotton = {
+                'production':  get_world_cotton('Production'),
+                'consumption': get_world_cotton('Consumption'),
+                'trade':       get_world_cotton('Trade'),
+                'endStocks':   get_world_cotton('Ending Stocks'),
+            }
+
+            corn = corn_future.result()
+            soybeans = soy_future.result()
+            wheat, wheat_by_class = wheat_future.result()
+    finally:
+        wb.release_resources()
 
-    world_cotton = {
-        'production':  get_col_row(world_cotton_rows, 'Production',   w_cotton_start),
-        'consumption': get_col_row(world_cotton_rows, 'Consumption',  w_cotton_start),
-        'trade':       get_col_row(world_cotton_rows, 'Trade',         w_cotton_start),
-        'endStocks':   get_col_row(world_cotton_rows, 'Ending Stocks', w_cotton_start),
-    }
+    month_names = ["", "January", "February", "March", "April", "May", "June",
+                   "July", "August", "September", "October", "November", "December"]
+    report_date = f"{month_names[month]} {year}"
 
     # -----------------------------------------------------------------------
     # Convert 4-element [23/24, 24/25, prev_mo, cur_mo] -> 3-element [23/24, 24/25, cur_mo]
@@ -354,7 +472,7 @@ def extract_data(xls_path, year, month):
         for k, v in d.items():
             if isinstance(v, dict):
                 result[k] = process_dict(v)
-            elif isinstance(v, list) and len(v) == 4 and all(isinstance(x, (int, float)) for x in v):
+            elif isinstance(v, list) and len(v) == 4 and type(v[0]) in (int, float):  # value rows are all-numeric
                 result[k] = to3(v)
             else:
                 result[k] = v
@@ -409,11 +527,11 @@ def extract_data(xls_path, year, month):
 def update_html(data):
     html = TEMPLATE_PATH.read_text(encoding='utf-8')
 
-    data_json = json.dumps(data, indent=2)
+    data_json = json.dumps(data, separators=(',', ':'))  # compact: only the browser reads it
 
-    pattern = r'const\s+WASDE_DATA\s*=\s*\{.*?\}\s*;\s*\n\s*//\s*=+\s*END\s+DATA\s*=+'
-    match = re.search(pattern, html, flags=re.DOTALL)
-    if not match:
+    start = html.find(DATA_START)
+    end = html.find(DATA_END, start) if start >= 0 else -1
+    if end < 0:
         idx = html.find('WASDE_DATA')
         if idx >= 0:
             print(f"  Found 'WASDE_DATA' at pos {idx}")
@@ -424,8 +542,8 @@ def update_html(data):
         print("WARNING: Could not find WASDE_DATA block to replace!")
         return False
 
-    replacement = f'const WASDE_DATA = {data_json};\n// ========== END DATA =========='
-    TEMPLATE_PATH.write_text(html[:match.start()] + replacement + html[match.end():], encoding='utf-8')
+    replacement = f'const WASDE_DATA = {data_json};\n'
+    TEMPLATE_PATH.write_text(html[:start] + replacement + html[end:], encoding='utf-8')
     print(f"  Updated {TEMPLATE_PATH}")
     return True
 
@@ -435,14 +553,23 @@ def main():
     now = datetime.now()
     parser.add_argument('--year',  type=int, default=now.year)
     parser.add_argument('--month', type=int, default=now.month)
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached downloads and extracted data')
     args = parser.parse_args()
 
-    xls = download_wasde(args.year, args.month)
+    xls = download_wasde(args.year, args.month, use_cache=not args.no_cache)
     if not xls:
         sys.exit(1)
 
-    print("Extracting data...")
-    data = extract_data(xls, args.year, args.month)
+    # Parsed data is cached by workbook + script hash, so a USDA repost or an extractor change invalidates it
+    digest = hashlib.sha256(xls.read_bytes() + Path(__file__).read_bytes()).hexdigest()
+    data_cache = CACHE_DIR / f"{digest}.json"
+    if not args.no_cache and data_cache.exists():
+        print(f"Using cached data {data_cache.name}")
+        data = json.loads(data_cache.read_text(encoding='utf-8'))
+    else:
+        print("Extracting data...")
+        data = extract_data(xls, args.year, args.month)
+        data_cache.write_text(json.dumps(data), encoding='utf-8')
 
     print(f"\nReport: {data['reportId']} — {data['reportDate']}")
     print(f"Corn  price: ${data['corn']['price'][2]}/bu  Ending stocks: {data['corn']['endStocks'][2]} mil bu")
@@ -466,8 +593,6 @@ def main():
     print("\nUpdating HTML...")
     if update_html(data):
         print("\n✅ Dashboard updated successfully!")
-        xls.unlink()
-        print(f"  Cleaned up {xls.name}")
     else:
         print("\n❌ Failed to update HTML")
         sys.exit(1)